@@ -1,72 +1,109 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-import copy
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import csv
-import functools
-import hashlib
-from typing import Any, Dict, Generator, List, Optional
+import os
+import sys
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    get_type_hints,
+)
 import uuid
 
 import rich
 
 NO_VALUE = "__NO_VALUE__"
 
+# Populated as `DataSource`s are created and `Feature`/`Entity` subclasses are defined
+_DATA_SOURCE_INSTANCES: List[DataSource] = []
+_FEATURE_CLASSES: List[type] = []
+_ENTITY_CLASSES: List[type] = []
+_FEATURES_BY_NAME: Dict[str, type] = {}
+_FEATURES_BY_ENTITY: Dict[type, List[type]] = {}
 
-def get_feature_class_by_name(feature_name: str) -> type:
-    for feature_class in Feature.__subclasses__():
-        if feature_class.name == feature_name:
-            return feature_class
-
-
-def global_classes(cls: type) -> Generator:
-    for _, obj in iterate_globals():
-        if isinstance(obj, type) and issubclass(obj, cls) and obj is not cls:
-            yield obj
 
-
-def global_instances(cls: type) -> Generator:
-    for _, obj in iterate_globals():
-        if isinstance(obj, cls):
-            yield obj
+def get_feature_class_by_name(feature_name: str) -> type:
+    return _FEATURES_BY_NAME.get(feature_name)
 
 
-def iterate_globals():
-    globals_keys = copy.copy(
-        list(globals().keys())
-    )  # So we can iterate over the keys without changing the dict
-    for globals_key in globals_keys:
-        obj = globals()[globals_key]
-        yield globals_key, obj
+class FeatureValueCache:
+    """
+    Holds feature values keyed by `Entity.get_feature_hash`. Values are kept for
+    the life of the cache unless their feature sets `cache_maxsize`, in which
+    case that feature only keeps its most recently calculated values.
+    Stipulated values can't be recalculated, so they are always kept.
+    """
 
+    __slots__ = ("_cache", "_bounded_caches")
 
-class FeatureValueCache:
     def __init__(self):
         self._cache = {}
+        self._bounded_caches: Dict[type, OrderedDict] = {}
 
     def __getitem__(self, key: Any) -> Any:
-        return self._cache.get(key, NO_VALUE)
+        value = self._cache.get(key, NO_VALUE)
+        if value is NO_VALUE:
+            bounded_cache = self._bounded_caches.get(key[1])
+            if bounded_cache is not None and key in bounded_cache:
+                bounded_cache.move_to_end(key)
+                value = bounded_cache[key]
+        return value
 
     def __setitem__(self, key: Any, value: Any) -> Any:
+        feature_class = key[1]
+        if feature_class.cache_maxsize is None or key in self._cache:
+            self._cache[key] = value
+            return
+        bounded_cache = self._bounded_caches.get(feature_class)
+        if bounded_cache is None:
+            bounded_cache = self._bounded_caches[feature_class] = OrderedDict()
+        bounded_cache[key] = value
+        bounded_cache.move_to_end(key)
+        if len(bounded_cache) > feature_class.cache_maxsize:
+            bounded_cache.popitem(last=False)
+
+    def stipulate(self, key: Any, value: Any) -> None:
+        """Stores a value that must never be evicted, whatever its feature's `cache_maxsize`."""
         self._cache[key] = value
+        bounded_cache = self._bounded_caches.get(key[1])
+        if bounded_cache is not None:
+            bounded_cache.pop(key, None)
 
     def __delitem__(self, key: Any) -> None:
-        del self._cache[key]
+        if key in self._cache:
+            del self._cache[key]
+        else:
+            del self._bounded_caches[key[1]][key]
 
     def __contains__(self, key: Any) -> bool:
-        return key in self._cache
+        if key in self._cache:
+            return True
+        bounded_cache = self._bounded_caches.get(key[1])
+        return bounded_cache is not None and key in bounded_cache
 
 
-class classproperty:
+class EntityFeatureMapping(NamedTuple):
     """
-    Plagiarized from https://stackoverflow.com/questions/76249636/class-properties-in-python-3-11
+    Says that the column `feature_key` of a data source holds the value of
+    `feature` for the entity named in the column `name_key`.
     """
 
-    def __init__(self, func):
-        self.fget = func
-
-    def __get__(self, instance, owner):
-        return self.fget(owner)
+    feature: type
+    feature_key: str
+    name_key: str
 
 
 class DataSource(ABC):
@@ -74,11 +111,24 @@ class DataSource(ABC):
     This is a class that represents a data source. It could be a CSV, a database, or anything else.
     """
 
+    __slots__ = (
+        "name",
+        "entity_feature_mappings",
+        "_entities",
+        "_by_name_key",
+        "_name_keys_by_entity",
+    )
+
     name: str
 
     def __init__(self, name: str = ""):
         self.name = name
         self.entity_feature_mappings = []
+        # Indexes over `entity_feature_mappings`, kept up to date as mappings are added
+        self._entities: Set[type] = set()
+        self._by_name_key: Dict[str, List[EntityFeatureMapping]] = defaultdict(list)
+        self._name_keys_by_entity: Dict[type, FrozenSet[str]] = {}
+        _DATA_SOURCE_INSTANCES.append(self)
 
     @abstractmethod
     def yield_data(self) -> Generator:
@@ -88,6 +138,15 @@ class DataSource(ABC):
         """
         pass
 
+    def yield_rows(self, columns: Sequence[Any]) -> Generator:
+        """
+        Yields each row as a tuple holding just the values of `columns`, in
+        that order. Subclasses can override this to skip building a
+        dictionary for every row.
+        """
+        for row in self.yield_data():
+            yield tuple(row[column] for column in columns)
+
     def __call__(self):
         return self.yield_data()
     
@@ -97,38 +156,36 @@ class DataSource(ABC):
     def add_entity_feature_mapping(
         self, feature: type, feature_key: str, name_key: str
     ) -> None:
-        entity_feature_mapping = {
-            "feature": feature,
-            "feature_key": feature_key,
-            "name_key": name_key,
-        }
+        if not (isinstance(feature, type) and issubclass(feature, Feature)):
+            raise TypeError(f"Expected a Feature subclass, got {feature!r}")
+        # Interned so they match the (also interned) CSV column names by identity.
+        # Other data sources can key their rows by anything hashable.
+        if isinstance(feature_key, str):
+            feature_key = sys.intern(feature_key)
+        if isinstance(name_key, str):
+            name_key = sys.intern(name_key)
+        entity_feature_mapping = EntityFeatureMapping(feature, feature_key, name_key)
         self.entity_feature_mappings.append(entity_feature_mapping)
+        entity = feature.entity
+        self._entities.add(entity)
+        self._by_name_key[name_key].append(entity_feature_mapping)
+        self._name_keys_by_entity[entity] = self._name_keys_by_entity.get(
+            entity, frozenset()
+        ) | {name_key}
 
     def has_entity(self, entity: type) -> bool:
-        return any(
-            [
-                entity_mapping["feature"].entity is entity
-                for entity_mapping in self.entity_feature_mappings
-            ]
-        )
+        return entity in self._entities
     
     def __iter__(self):
         return self.yield_data()
     
-    def entity_name_keys(self, entity: type) -> List[str]:
-        return set(
-            entity_mapping["name_key"]
-            for entity_mapping in self.entity_feature_mappings
-            if entity_mapping["feature"].entity is entity
-        )
+    def entity_name_keys(self, entity: type) -> FrozenSet[str]:
+        return self._name_keys_by_entity.get(entity, frozenset())
     
-    def entity_feature_mapping_for_name_key(self, name_key: str) -> Generator:
-        for entity_feature_mapping in self.entity_feature_mappings:
-            if entity_feature_mapping["name_key"] == name_key:
-                yield entity_feature_mapping
-    
-    def __lt__(self, other):
-        self.add_entity_feature_mapping(*other)
+    def entity_feature_mapping_for_name_key(
+        self, name_key: str
+    ) -> Iterator[EntityFeatureMapping]:
+        return iter(self._by_name_key.get(name_key, ()))
 
 
 class CSVDataSource(DataSource):
@@ -136,8 +193,10 @@ class CSVDataSource(DataSource):
     This is a subclass of `DataSource` that represents a CSV file.
     """
 
+    __slots__ = ("path", "dialect")
+
     path: str
-    dialect: Optional[str] = None
+    dialect: Optional[str]
 
     def __init__(self, name: str, path: str, dialect: Optional[str] = None):
         self.name = name
@@ -151,6 +210,21 @@ class CSVDataSource(DataSource):
             for row in dict_reader:
                 yield row
 
+    def yield_rows(self, columns: Sequence[Any]) -> Generator:
+        with open(self.path) as f:
+            csv_reader = csv.reader(f, dialect=self.dialect)
+            header = next(csv_reader, None)
+            if header is None:
+                return
+            column_index = {
+                sys.intern(column): index for index, column in enumerate(header)
+            }
+            indexes = [column_index[column] for column in columns]
+            # Skip blank lines, as `csv.DictReader` does
+            for row in csv_reader:
+                if row:
+                    yield tuple(row[index] for index in indexes)
+
 
 class DataCatalog:
     """
@@ -171,24 +245,82 @@ class DataCatalog:
                 return data_source
 
 
+class _ResolvedDependencies:
+    """
+    A class attribute of `Feature` that resolves the feature's dependencies the
+    first time it's read. The results are stored on the subclass itself, so
+    after that they're ordinary class attributes.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if owner is Feature:
+            return ()
+        owner._resolve_dependencies()
+        return owner.__dict__[self.name]
+
+
 class Feature:
     name: str
     data_sources: Optional[List[DataSource]] = []
     entity: type
+    dependency_names: Tuple[str, ...] = _ResolvedDependencies()
+    dependency_classes: Tuple[type, ...] = _ResolvedDependencies()
+    topological_order: Tuple[type, ...] = _ResolvedDependencies()
+    # Set this on features that are cheap to recalculate to bound how many values are cached
+    cache_maxsize: Optional[int] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Otherwise a subclass of an already resolved feature would inherit its dependencies
+        for attribute in ("dependency_names", "dependency_classes", "topological_order"):
+            setattr(cls, attribute, Feature.__dict__[attribute])
+        _FEATURE_CLASSES.append(cls)
+        if hasattr(cls, "name"):
+            _FEATURES_BY_NAME[cls.name] = cls
+        if hasattr(cls, "entity"):
+            _FEATURES_BY_ENTITY.setdefault(cls.entity, []).append(cls)
+            if isinstance(cls.entity, type) and issubclass(cls.entity, Entity):
+                cls.entity.feature_list = tuple(_FEATURES_BY_ENTITY[cls.entity])
+            if getattr(cls.entity, "_has_compiled_repr", False):
+                cls.entity._compile_repr()
 
-    @classproperty
-    def dependency_names(cls) -> List[str]:
-        return [
-            name for name in cls.calculate.__annotations__.keys() if name != "return"
-        ]
-
-    @classproperty
-    def dependency_classes(cls) -> List[type]:
-        return [
-            globals()[class_name]
-            for class_name_string, class_name in cls.calculate.__annotations__.items()
-            if class_name_string != "return"
-        ]
+    @classmethod
+    def _resolve_dependencies(cls):
+        """
+        Resolve the dependencies declared in `calculate`'s annotations once,
+        rather than every time they're needed. This waits until they're first
+        needed so that a feature can depend on one defined further down.
+        """
+        dependency_names = ()
+        dependency_classes = ()
+        calculate = getattr(cls, "calculate", None)
+        if calculate is not None:
+            try:
+                type_hints = get_type_hints(
+                    calculate, globalns=sys.modules[cls.__module__].__dict__
+                )
+            except NameError as error:
+                raise NameError(
+                    f"Can't resolve the dependencies of feature {cls.__name__}: "
+                    f"{error}. Features it depends on must be defined or imported "
+                    f"in {cls.__module__} before its value is calculated."
+                ) from error
+            type_hints.pop("return", None)
+            dependency_names = tuple(type_hints.keys())
+            dependency_classes = tuple(type_hints.values())
+        # Each dependency resolves its own order, so we only have to merge them
+        topological_order = {}
+        for dependency_class in dependency_classes:
+            topological_order.update(
+                dict.fromkeys(dependency_class.topological_order)
+            )
+        topological_order[cls] = None
+        cls.dependency_names = dependency_names
+        cls.dependency_classes = dependency_classes
+        cls.topological_order = tuple(topological_order)
 
     def raw_process(self, value: Any) -> Any:
         """Just a placeholder."""
@@ -197,6 +329,44 @@ class Feature:
 
 class Entity:
     name = "entity"
+    feature_list: Tuple[type, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _ENTITY_CLASSES.append(cls)
+        # Rebuilt by `Feature.__init_subclass__` as features are registered
+        cls.feature_list = tuple(_FEATURES_BY_ENTITY.setdefault(cls, []))
+        # Leave a `__repr__` the subclass (or a class between it and `Entity`) wrote alone
+        cls._has_compiled_repr = cls.__repr__ is Entity.__repr__ or getattr(
+            cls.__repr__, "is_compiled_repr", False
+        )
+        if cls._has_compiled_repr:
+            cls._compile_repr()
+
+    @classmethod
+    def _compile_repr(cls):
+        """
+        The features of an entity class are fixed once they're defined, so
+        rather than looping over them every time, generate a `__repr__` with
+        one f-string that already has the feature names baked in. This is
+        re-run whenever another feature is added to the class.
+        """
+        namespace = {}
+        fields = []
+        for index, feature_class in enumerate(cls.feature_list):
+            namespace[f"_feature_{index}"] = feature_class
+            label = feature_class.name.replace("{", "{{").replace("}", "}}")
+            fields.append(f"{label}={{calculate(_feature_{index})}}")
+        template = "{self.name}: (" + ", ".join(fields) + ")"
+        source = (
+            "def __repr__(self):\n"
+            "    calculate = self.calculate_feature_value\n"
+            f"    return f{template!r}\n"
+        )
+        exec(source, namespace)
+        compiled_repr = namespace["__repr__"]
+        compiled_repr.is_compiled_repr = True
+        cls.__repr__ = compiled_repr
 
     def __init__(self, session: Session = None, name: str = ""):
         self.value_cache = session.cache  #This will be set by the `Session` object
@@ -215,41 +385,55 @@ class Entity:
     def get_table(self):
         pass
 
-    def get_feature_hash(self, feature_class: type) -> str:
-        unique = ''.join([self.__class__.__name__, feature_class.__name__, self.name])
-        return hashlib.md5(unique.encode()).hexdigest()
+    def get_feature_hash(self, feature_class: type) -> Tuple[type, type, str]:
+        # The cache never leaves the process, so a plain tuple is a good enough key
+        return (self.__class__, feature_class, self.name)
 
     def calculate_feature_value(self, feature_class: type):
         """
-        This is a recursive function that calculates the value of a feature
-        by calculating the values of its dependencies.
+        Calculates the value of a feature by walking its dependencies in
+        topological order, so every dependency is ready before it's needed.
         """
         # If the value is already in the cache, return it
         feature_hash = self.get_feature_hash(feature_class)
-        if feature_hash in self.value_cache:
-            value = self.value_cache[feature_hash]
-        else:
-            for dependency_class in feature_class.dependency_classes:
-                dependency_value = self.calculate_feature_value(dependency_class)
-                self.value_cache[self.get_feature_hash(dependency_class)] = dependency_value
-            arguments = [
-                self.value_cache[self.get_feature_hash(dependency_class)]
-                for dependency_class in feature_class.dependency_classes
-            ]
-            value = feature_class.calculate(self, *arguments)
-            self.value_cache[self.get_feature_hash(feature_class)] = value
+        value = self.value_cache[feature_hash]
+        if value is not NO_VALUE:
+            return value
+        # Walk back from `feature_class` (the last entry in the order) to find the
+        # dependencies that actually need calculating. Anything already cached
+        # stops the walk there, so whatever it depends on isn't touched.
+        needed = set(feature_class.dependency_classes)
+        values = {}
+        uncached = []
+        for dependency_class in reversed(feature_class.topological_order[:-1]):
+            if dependency_class not in needed:
+                continue
+            dependency_hash = self.get_feature_hash(dependency_class)
+            value = self.value_cache[dependency_hash]
+            if value is NO_VALUE:
+                uncached.append((dependency_class, dependency_hash))
+                needed.update(dependency_class.dependency_classes)
+            else:
+                values[dependency_class] = value
+        # Then calculate those in topological order, so every argument is ready
+        for dependency_class, dependency_hash in reversed(uncached):
+            arguments = [values[d] for d in dependency_class.dependency_classes]
+            value = dependency_class.calculate(self, *arguments)
+            self.value_cache[dependency_hash] = value
+            values[dependency_class] = value
+        arguments = [values[d] for d in feature_class.dependency_classes]
+        value = feature_class.calculate(self, *arguments)
+        self.value_cache[feature_hash] = value
         return value
     
     def stipulate_feature_value(self, feature_class: type, value: Any):
-        self.value_cache[self.get_feature_hash(feature_class)] = feature_class.value_type(value)
+        self.value_cache.stipulate(
+            self.get_feature_hash(feature_class), feature_class.value_type(value)
+        )
 
     @classmethod
     def get_features(cls):
-        feature_list = []
-        for feature_class in Feature.__subclasses__():
-            if feature_class.entity is cls:
-                feature_list.append(feature_class)
-        return feature_list
+        return list(cls.feature_list)
 
     @classmethod
     def get_data_sources(cls):
@@ -259,14 +443,17 @@ class Entity:
                 data_sources.append(data_source)
         return data_sources
 
-    @classproperty
-    def feature_list(cls):
-        return cls.get_features()
+
+def data_sources() -> List[DataSource]:
+    return _DATA_SOURCE_INSTANCES
 
 
-data_sources = functools.partial(global_instances, DataSource)
-features = functools.partial(global_classes, Feature)
-entities = functools.partial(global_classes, Entity)
+def features() -> List[type]:
+    return _FEATURE_CLASSES
+
+
+def entities() -> List[type]:
+    return _ENTITY_CLASSES
 
 
 class Session:
@@ -276,6 +463,7 @@ class Session:
         self.features = []
         self.cache = FeatureValueCache()
         self.session_id = uuid.uuid4().hex
+        self._entities_by_name: Dict[Tuple[type, str], Entity] = {}
     
     def __enter__(self):
         self.populate()
@@ -298,10 +486,28 @@ class Session:
         self.features.append(feature)
         feature.session = self
 
-    def data_sources_with_entity(self, entity: type) -> Generator:
-        for data_source in self.data_sources:
-            if data_source.has_entity(entity):
-                yield data_source
+    def get_entity(self, entity_type: type, name: str) -> Entity:
+        """
+        Returns the session's entity of this type and name, creating it the
+        first time it's asked for. Reusing it means features stipulated from
+        different rows or data sources all end up on the same entity.
+        """
+        entity_key = (entity_type, name)
+        entity = self._entities_by_name.get(entity_key)
+        if entity is None:
+            entity = self._entities_by_name[entity_key] = entity_type(
+                session=self, name=name
+            )
+        return entity
+
+    def data_sources_with_entity(self, entity: type) -> Iterator[DataSource]:
+        # `has_entity` is a set lookup, and asking each data source means
+        # mappings added after it joined the session are never missed
+        return (
+            data_source
+            for data_source in self.data_sources
+            if data_source.has_entity(entity)
+        )
 
     def populate(self): 
         for data_source in data_sources():
@@ -310,27 +516,95 @@ class Session:
             self.add_feature(feature)
         for entity in entities():
             self.add_entity(entity)
-            entity.value_cache = self.cache
         
+    def _read_feature_values(
+        self, data_source: DataSource, entity_type: type
+    ) -> Generator:
+        """
+        Yields the raw values of `entity_type`'s features from one data source,
+        as an entity name and its (feature, value) pairs for each row and name
+        key. It doesn't touch the session, so data sources can be read in parallel.
+        """
+        # The mappings don't change from row to row, so look them up once
+        mappings_by_name_key = {
+            entity_name_key: [
+                (mapping.feature, mapping.feature_key)
+                for mapping in data_source.entity_feature_mapping_for_name_key(
+                    entity_name_key
+                )
+                if mapping.feature.entity is entity_type
+            ]
+            for entity_name_key in data_source.entity_name_keys(entity_type)
+        }
+        # Only the mapped columns are read, each once however many mappings use it
+        column_index = {}
+        for entity_name_key, feature_mappings in mappings_by_name_key.items():
+            column_index.setdefault(entity_name_key, len(column_index))
+            for _, feature_key in feature_mappings:
+                column_index.setdefault(feature_key, len(column_index))
+        column_indexes_by_name_key = [
+            (
+                column_index[entity_name_key],
+                [
+                    (feature, column_index[feature_key])
+                    for feature, feature_key in feature_mappings
+                ],
+            )
+            for entity_name_key, feature_mappings in mappings_by_name_key.items()
+        ]
+        for row in data_source.yield_rows(list(column_index)):
+            for name_index, feature_mappings in column_indexes_by_name_key:
+                yield (
+                    row[name_index],
+                    [
+                        (feature, row[feature_index])
+                        for feature, feature_index in feature_mappings
+                    ],
+                )
+
+    def _stipulate_feature_values(
+        self, entity_type: type, feature_values: Iterable, dumped_entities: dict
+    ):
+        for entity_name, entity_feature_values in feature_values:
+            entity = self.get_entity(entity_type, entity_name)
+            for feature, feature_value in entity_feature_values:
+                entity.stipulate_feature_value(feature, feature_value)
+            dumped_entities[entity] = None
+
     def dump(self):
         for entity_type in self.entities:
             rich.print(f'Entity type: {entity_type.__name__}')
-            for data_source in self.data_sources_with_entity(entity_type):
-                entity_name_keys = data_source.entity_name_keys(entity_type)
-                for row in data_source():
-                    for entity_name_key in entity_name_keys:
-                        entity_name = row[entity_name_key]
-                        for entity_feature_mapping in data_source.entity_feature_mapping_for_name_key(
-                            entity_name_key
-                        ):
-                            feature = entity_feature_mapping["feature"]
-                            feature_key = entity_feature_mapping["feature_key"]
-                            feature_value = row[feature_key]
-                            entity_name = row[entity_name_key]
-                            entity_cls = feature.entity
-                            entity = entity_cls(session=self, name=entity_name)
-                            entity.stipulate_feature_value(feature, feature_value)
-                        rich.print(entity)
+            # Every entity of this type seen in any data source, in order of appearance
+            dumped_entities = {}
+            entity_data_sources = list(self.data_sources_with_entity(entity_type))
+            if len(entity_data_sources) == 1:
+                # Nothing to overlap with, so stream the rows straight in
+                self._stipulate_feature_values(
+                    entity_type,
+                    self._read_feature_values(entity_data_sources[0], entity_type),
+                    dumped_entities,
+                )
+            elif entity_data_sources:
+                # Reading the data sources is mostly I/O, so do it in parallel and
+                # only stipulate the values back here, one data source at a time.
+                # Each data source is read into memory in full before it's stipulated.
+                max_workers = min(len(entity_data_sources), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            list, self._read_feature_values(data_source, entity_type)
+                        )
+                        for data_source in entity_data_sources
+                    ]
+                    for future in futures:
+                        self._stipulate_feature_values(
+                            entity_type, future.result(), dumped_entities
+                        )
+            # Rendering each entity as it goes dominates the loop, so write them all at once
+            if dumped_entities:
+                sys.stdout.write(
+                    "\n".join(repr(entity) for entity in dumped_entities) + "\n"
+                )
 
 # Everything above this would be imported by the data scientist or MLE
 # Everything below this is configuration
@@ -394,8 +668,12 @@ if __name__ == "__main__":
 
     # Now we configure the data source by telling it which columns correspond to which features
     # Notice that the CSV has length and width, but no area.
-    rectangle_size_data_source < (Width, "w_col", "rectangle_id")
-    rectangle_size_data_source < (Length, "len_col", "rectangle_id")
+    rectangle_size_data_source.add_entity_feature_mapping(
+        Width, "w_col", "rectangle_id"
+    )
+    rectangle_size_data_source.add_entity_feature_mapping(
+        Length, "len_col", "rectangle_id"
+    )
 
     # Now we define a session and print all the Rectangle objects
     with Session() as session: 